@@ -4,28 +4,35 @@ All requests are scoped to the authenticated user — the server enforces
 that each user can only read/write their own knowledge base.
 """
 
+import gzip
+import json
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-import requests
+from mdlm.config import compress_requests_enabled, get_api_key, get_api_url
+from mdlm.constants import VALID_CATEGORIES, VALID_CATEGORIES_HELP  # noqa: F401 (re-export)
 
-from mdlm.config import get_api_key, get_api_url
+if TYPE_CHECKING:
+    import httpx
 
 # Timeout for all requests (connect, read) in seconds
 _TIMEOUT = (10, 30)
 
-VALID_CATEGORIES = {
-    "architecture",
-    "stack",
-    "testing",
-    "deployment",
-    "security",
-    "style",
-    "dependencies",
-    "error_handling",
-    "business_logic",
-    "general",
-}
+# Keep-alive connections per host; must cover the CLI's concurrent workers.
+# Over HTTP/2 most requests share one connection as multiplexed streams.
+_POOL_SIZE = 32
+
+# Transient failures are retried with exponential backoff.  Failed connects
+# are retried for every method; read errors and retryable statuses only for
+# _RETRY_METHODS, since POST (e.g. creating a doc) is not idempotent.
+_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = frozenset([429, 502, 503, 504])
+_RETRY_METHODS = frozenset(["GET", "OPTIONS", "PUT", "DELETE"])
+
+# Request bodies larger than this are gzipped when MDLM_COMPRESS_REQUESTS=1
+_COMPRESS_MIN_BYTES = 4096
 
 
 class ApiError(Exception):
@@ -37,22 +44,77 @@ class ApiError(Exception):
 
 class ApiClient:
     def __init__(self) -> None:
+        # Imported here so commands that never touch the network (status,
+        # configure, --help) don't pay for loading httpx.
+        import httpx
+
         self._api_key = get_api_key()
         self._base_url = get_api_url()
-        self._session = requests.Session()
+        self._compress_requests = compress_requests_enabled()
+        self._batch_supported: Optional[bool] = None  # see supports_batch
+        # No explicit transport: that would disable HTTPS_PROXY/NO_PROXY
+        # handling.  Retries are done in _request.  httpx negotiates
+        # gzip/deflate (and br/zstd when a decoder is installed) on its own.
         # Never log the Authorization header
-        self._session.headers.update(
-            {
+        self._http = httpx.Client(
+            http2=True,
+            follow_redirects=True,  # as requests did, e.g. bare domain → www.
+            limits=httpx.Limits(
+                max_connections=_POOL_SIZE, max_keepalive_connections=_POOL_SIZE
+            ),
+            timeout=httpx.Timeout(_TIMEOUT[0], read=_TIMEOUT[1]),
+            headers={
                 "Authorization": f"Bearer {self._api_key}",
                 "Content-Type": "application/json",
                 "Accept": "application/json",
-            }
+            },
         )
 
     def _url(self, path: str) -> str:
         return f"{self._base_url}{path}"
 
-    def _handle_response(self, resp: requests.Response) -> Dict[str, Any]:
+    def _request(
+        self, method: str, path: str, stream: bool = False, **kwargs: Any
+    ) -> "httpx.Response":
+        """Send a request, retrying connect failures for any method and read
+        errors/transient statuses for idempotent ones."""
+        import httpx
+
+        request = self._http.build_request(method, self._url(path), **kwargs)
+        attempt = 0
+        while True:
+            delay = _RETRY_BACKOFF * 2 ** attempt
+            try:
+                resp = self._http.send(request, stream=stream)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # Nothing reached the server, so even POST is safe to resend
+                if attempt == _RETRIES:
+                    raise
+            except (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError):
+                if method not in _RETRY_METHODS or attempt == _RETRIES:
+                    raise
+            else:
+                if (
+                    method not in _RETRY_METHODS
+                    or resp.status_code not in _RETRY_STATUSES
+                    or attempt == _RETRIES
+                ):
+                    return resp
+                resp.close()
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = int(retry_after)
+            time.sleep(delay)
+            attempt += 1
+
+    def _encode_json(self, payload: Any) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize a request body, gzipping it if enabled and large enough."""
+        body = json.dumps(payload).encode("utf-8")
+        if self._compress_requests and len(body) > _COMPRESS_MIN_BYTES:
+            return gzip.compress(body), {"Content-Encoding": "gzip"}
+        return body, {}
+
+    def _check_response(self, resp: "httpx.Response") -> None:
         if resp.status_code == 401:
             print(
                 "Error: Authentication failed. "
@@ -66,38 +128,81 @@ class ApiClient:
                 file=sys.stderr,
             )
             sys.exit(1)
-        if not resp.ok:
+        if not resp.is_success:
+            resp.read()  # streamed responses haven't loaded the error body yet
             try:
                 detail = resp.json().get("error", resp.text[:200])
             except Exception:
                 detail = resp.text[:200]
             raise ApiError(resp.status_code, detail)
+
+    def _handle_response(self, resp: "httpx.Response") -> Dict[str, Any]:
+        self._check_response(resp)
         return resp.json()
 
-    def list_docs(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_docs(
+        self,
+        category: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield docs one at a time, parsing the body incrementally if ijson is
+        installed.  Errors are raised on iteration, not when called.
+
+        *fields* asks the server for only those keys (e.g. ("id", "version"))
+        when the caller doesn't need doc content.
+        """
+        try:
+            import ijson  # optional: stream large doc lists instead of buffering them
+        except ImportError:
+            ijson = None
+
         params: Dict[str, str] = {}
         if category:
             params["category"] = category
-        resp = self._session.get(
-            self._url("/api/knowledge"), params=params, timeout=_TIMEOUT
+        if fields:
+            params["fields"] = ",".join(fields)
+        resp = self._request(
+            "GET", "/api/knowledge", params=params, stream=ijson is not None
         )
-        data = self._handle_response(resp)
-        return data.get("docs", [])
+        if ijson is None:
+            yield from self._handle_response(resp).get("docs", [])
+            return
+        try:
+            self._check_response(resp)
+            docs = ijson.sendable_list()
+            parser = ijson.items_coro(docs, "docs.item", use_float=True)
+            for chunk in resp.iter_bytes():  # already decompressed
+                parser.send(chunk)
+                yield from docs
+                del docs[:]
+            parser.close()
+            yield from docs
+        finally:
+            resp.close()
 
-    def get_doc(self, doc_id: str) -> Dict[str, Any]:
-        resp = self._session.get(
-            self._url(f"/api/knowledge/{doc_id}"), timeout=_TIMEOUT
-        )
+    def get_doc(
+        self, doc_id: str, etag: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a doc.  With *etag*, returns None if the server copy is unchanged.
+
+        The response ETag, when present, is returned under the doc's "etag" key.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        resp = self._request("GET", f"/api/knowledge/{doc_id}", headers=headers)
+        if etag and resp.status_code == 304:
+            return None
         data = self._handle_response(resp)
-        return data.get("doc", data)
+        doc = data.get("doc", data)
+        if resp.headers.get("ETag"):
+            doc["etag"] = resp.headers["ETag"]
+        return doc
 
     def create_doc(
         self, title: str, content: str, category: str
     ) -> Dict[str, Any]:
         payload = {"title": title, "content": content, "category": category}
-        resp = self._session.post(
-            self._url("/api/knowledge"), json=payload, timeout=_TIMEOUT
-        )
+        body, headers = self._encode_json(payload)
+        resp = self._request("POST", "/api/knowledge", content=body, headers=headers)
         data = self._handle_response(resp)
         return data.get("doc", data)
 
@@ -108,7 +213,10 @@ class ApiClient:
         content: str,
         category: str,
         change_reason: Optional[str] = None,
+        version: Optional[int] = None,
     ) -> Dict[str, Any]:
+        """Update a doc.  With *version*, the server rejects the write (409/412)
+        if the doc has moved on since that version."""
         payload: Dict[str, Any] = {
             "title": title,
             "content": content,
@@ -116,16 +224,48 @@ class ApiClient:
         }
         if change_reason:
             payload["change_reason"] = change_reason
-        resp = self._session.put(
-            self._url(f"/api/knowledge/{doc_id}"), json=payload, timeout=_TIMEOUT
+        body, headers = self._encode_json(payload)
+        if version is not None:
+            headers["If-Match"] = str(version)
+        resp = self._request(
+            "PUT", f"/api/knowledge/{doc_id}", content=body, headers=headers
         )
         data = self._handle_response(resp)
         return data.get("doc", data)
 
-    def delete_doc(self, doc_id: str) -> None:
-        resp = self._session.delete(
-            self._url(f"/api/knowledge/{doc_id}"), timeout=_TIMEOUT
+    def supports_batch(self) -> bool:
+        """Whether the server offers POST /api/knowledge/batch (probed once)."""
+        if self._batch_supported is None:
+            resp = self._request("OPTIONS", "/api/knowledge/batch")
+            self._batch_supported = resp.is_success
+        return self._batch_supported
+
+    def push_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply several doc updates in one request.
+
+        Each item carries id, title, content, category, version and optionally
+        change_reason.  Returns one result per item, in order: {"doc": {...}}
+        on success, or {"status": <int>, "error": "..."} if that item failed
+        (409/412 for a version conflict).
+        """
+        body, headers = self._encode_json(items)
+        resp = self._request(
+            "POST", "/api/knowledge/batch", content=body, headers=headers
         )
+        if resp.status_code in (404, 405):
+            # Some servers answer OPTIONS for any path; trust the POST instead
+            self._batch_supported = False
+        data = self._handle_response(resp)
+        results = data.get("results", [])
+        if len(results) != len(items):
+            raise ApiError(
+                resp.status_code,
+                f"batch returned {len(results)} result(s) for {len(items)} item(s)",
+            )
+        return results
+
+    def delete_doc(self, doc_id: str) -> None:
+        resp = self._request("DELETE", f"/api/knowledge/{doc_id}")
         self._handle_response(resp)
 
     def query_knowledge_base(
@@ -133,9 +273,7 @@ class ApiClient:
     ) -> Dict[str, Any]:
         """Query the knowledge base with a question and category."""
         payload = {"query": query, "category": category}
-        resp = self._session.post(
-            self._url("/api/validation/query"), json=payload, timeout=_TIMEOUT
-        )
+        resp = self._request("POST", "/api/validation/query", json=payload)
         data = self._handle_response(resp)
         return data
 
@@ -144,9 +282,7 @@ class ApiClient:
     ) -> Dict[str, Any]:
         """Validate code against documented rules."""
         payload = {"code": code, "task": task, "category": category}
-        resp = self._session.post(
-            self._url("/api/validation/validate"), json=payload, timeout=_TIMEOUT
-        )
+        resp = self._request("POST", "/api/validation/validate", json=payload)
         data = self._handle_response(resp)
         return data
 
@@ -155,8 +291,6 @@ class ApiClient:
     ) -> Dict[str, Any]:
         """Resolve a documentation gap."""
         payload = {"query": question, "category": category}
-        resp = self._session.post(
-            self._url("/api/gaps/detect"), json=payload, timeout=_TIMEOUT
-        )
+        resp = self._request("POST", "/api/gaps/detect", json=payload)
         data = self._handle_response(resp)
         return data
@@ -20,30 +20,53 @@ Usage examples
 
 import argparse
 import getpass
+import hashlib
 import os
 import sys
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 from mdlm import __version__
 from mdlm import manifest as mf
-from mdlm.api import ApiClient, ApiError, VALID_CATEGORIES
+from mdlm.api import ApiClient, ApiError
+from mdlm.constants import VALID_CATEGORIES, VALID_CATEGORIES_HELP
 from mdlm.config import get_api_url, save_api_key
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 # Where cloned docs live relative to cwd
 _KNOWLEDGE_DIR = "knowledge"
 
+# Concurrent requests used by `pull`; keep <= the ApiClient connection pool size
+_MAX_WORKERS = 16
+
+# Updates sent per request when the server supports batched pushes
+_BATCH_SIZE = 32
+
+# A file whose mtime is this close to (or after) its recorded sync time may have
+# been edited again within the same mtime tick, so its stat can't be trusted
+# ("racily clean" in git).  2s covers FAT and SMB timestamp granularity.
+_RACY_MARGIN_NS = 2_000_000_000
+
+# A changed tracked file waiting to be pushed:
+# (rel_path, manifest entry, content, content hash, stat at read time)
+_PendingUpdate = Tuple[str, mf.Entry, str, str, os.stat_result]
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Used by _safe_filename; built once instead of per call
+_FN_TRANS = str.maketrans({"/": "_", "\\": "_", "\x00": "_"})
+
+
 def _safe_filename(name: str) -> str:
     """Sanitize a title so it's safe to use as a filename."""
     # Replace path separators and null bytes; strip leading dots/spaces
-    for ch in ("/", "\\", "\x00"):
-        name = name.replace(ch, "_")
-    return name.strip(". ") or "_"
+    return name.translate(_FN_TRANS).strip(". ") or "_"
 
 
 def _local_path(category: str, title: str) -> str:
@@ -51,17 +74,156 @@ def _local_path(category: str, title: str) -> str:
     return os.path.join(_KNOWLEDGE_DIR, _safe_filename(category), _safe_filename(title))
 
 
-def _read_local(rel_path: str) -> Optional[str]:
-    p = Path(rel_path)
-    if not p.exists():
+def _sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_normalized(path: Path) -> bytes:
+    """Read a file with universal-newline semantics, like read_text() did.
+
+    Hashes and uploads always use LF endings, so files written with CRLF (e.g.
+    by older versions on Windows, or by editors) match the manifest and are
+    not pushed with CRLF.
+    """
+    return path.read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def _stat_local(rel_path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(rel_path)
+    except FileNotFoundError:
         return None
-    return p.read_text(encoding="utf-8")
 
 
-def _write_local(rel_path: str, content: str) -> None:
+def _stat_fields(st: os.stat_result) -> Dict[str, int]:
+    """Manifest fields that let status/push skip re-hashing untouched files."""
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "synced_ns": time.time_ns()}
+
+
+def _modified_data(rel_path: str, entry: mf.Entry, st: os.stat_result) -> Optional[bytes]:
+    """Return a tracked file's bytes if it differs from the last sync, else None.
+
+    Like git's index, a file whose size and mtime match the manifest is assumed
+    unchanged and not read at all, unless that mtime is too close to the sync
+    time to rule out a later same-size edit; otherwise the content hash decides.
+    """
+    if (
+        entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("size") == st.st_size
+        and st.st_mtime_ns < entry.get("synced_ns", 0) - _RACY_MARGIN_NS
+    ):
+        return None
+    data = _read_normalized(Path(rel_path))
+    if _sha256_hex(data) == entry.get("content_hash"):
+        return None
+    return data
+
+
+def _scan_local() -> Dict[str, Path]:
+    """Map every .md file under knowledge/ to its Path in a single walk."""
+    knowledge_dir = Path(_KNOWLEDGE_DIR)
+    if not knowledge_dir.exists():
+        return {}
+    return {str(p): p for p in knowledge_dir.rglob("*.md")}
+
+
+def _write_local_bytes(rel_path: str, data: bytes) -> os.stat_result:
+    # Callers hash the same bytes they write, so content is encoded only once
     p = Path(rel_path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(content, encoding="utf-8")
+    p.write_bytes(data)
+    return p.stat()
+
+
+def _report_conflict(
+    client: ApiClient, rel_path: str, doc_id: str, local_version: int
+) -> None:
+    """Explain a rejected update, fetching the server version for the message."""
+    try:
+        remote_version = client.get_doc(doc_id).get("version", "?")
+    except ApiError:
+        remote_version = "?"
+    print(
+        f"  conflict {rel_path}: "
+        f"local version {local_version} != server version {remote_version}.\n"
+        f"           Run `mdlm pull` to get the latest, then re-apply your edits.",
+        file=sys.stderr,
+    )
+
+
+def _push_updates(
+    client: ApiClient,
+    pending: List[_PendingUpdate],
+    change_reason: Optional[str],
+) -> Iterator[Tuple[_PendingUpdate, Dict[str, Any]]]:
+    """Send updates, batched if the server supports it, yielding each with its
+    result: {"doc": {...}} or {"status": <int>, "error": "..."}."""
+    i = 0
+    while len(pending) - i > 1 and client.supports_batch():
+        chunk = pending[i:i + _BATCH_SIZE]
+        items = []
+        for _, entry, content, _, _ in chunk:
+            item = {
+                "id": entry["id"],
+                "title": entry["title"],
+                "content": content,
+                "category": entry["category"],
+                "version": entry.get("version", 0),
+            }
+            if change_reason:
+                item["change_reason"] = change_reason
+            items.append(item)
+        try:
+            results = client.push_batch(items)
+        except ApiError as e:
+            if not client.supports_batch():
+                break  # endpoint missing after all; send the rest one by one
+            results = [{"status": e.status, "error": e.message}] * len(chunk)
+        yield from zip(chunk, results)
+        i += len(chunk)
+
+    for update in pending[i:]:
+        _, entry, content, _, _ = update
+        try:
+            result: Dict[str, Any] = {
+                "doc": client.update_doc(
+                    entry["id"],
+                    entry["title"],
+                    content,
+                    entry["category"],
+                    change_reason=change_reason,
+                    version=entry.get("version", 0),
+                )
+            }
+        except ApiError as e:
+            result = {"status": e.status, "error": e.message}
+        yield update, result
+
+
+def _persist_doc(rel: str, doc: Dict[str, Any]) -> mf.Entry:
+    """Write a fetched doc to *rel*; return its manifest entry."""
+    data = doc.get("content", "").encode("utf-8")
+    st = _write_local_bytes(rel, data)
+    return {
+        "id": doc["id"],
+        "version": doc["version"],
+        "category": doc["category"],
+        "title": doc["title"],
+        "content_hash": _sha256_hex(data),
+        **_stat_fields(st),
+    }
+
+
+def _apply_persisted(
+    manifest: mf.Manifest,
+    pending: "Deque[Tuple[str, Future[mf.Entry]]]",
+    in_flight: "Dict[str, Future[mf.Entry]]",
+) -> None:
+    """Add the oldest pending clone write to the manifest."""
+    rel, future = pending.popleft()
+    mf.add_entry(manifest, rel, future.result())
+    if in_flight.get(rel) is future:
+        del in_flight[rel]
 
 
 # ---------------------------------------------------------------------------
@@ -94,44 +256,51 @@ def cmd_clone(args: argparse.Namespace) -> None:
     if category and category not in VALID_CATEGORIES:
         print(
             f"Error: Unknown category '{category}'.\n"
-            f"Valid categories: {', '.join(sorted(VALID_CATEGORIES))}",
+            f"Valid categories: {VALID_CATEGORIES_HELP}",
             file=sys.stderr,
         )
         sys.exit(1)
 
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
     client = ApiClient()
     print(f"Fetching docs from {get_api_url()} …")
+
+    # Docs are written and hashed on a small pool as they stream in.  At most
+    # 2 * workers are in flight so memory stays flat on large KBs, and results
+    # are applied in arrival order so the manifest matches a serial clone.
+    workers = min(8, os.cpu_count() or 4)
+    manifest: mf.Manifest = {}
+    pending: "Deque[Tuple[str, Future[mf.Entry]]]" = deque()
+    in_flight: "Dict[str, Future[mf.Entry]]" = {}  # rel path → latest write
+    written = 0
     try:
-        docs = client.list_docs(category=category)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for doc in client.list_docs(category=category):
+                rel = _local_path(doc["category"], doc["title"])
+                earlier = in_flight.get(rel)
+                if earlier is not None:
+                    # Two titles sanitized to the same path: let the earlier
+                    # write finish so the last doc wins, as in a serial clone
+                    earlier.result()
+                future = pool.submit(_persist_doc, rel, doc)
+                in_flight[rel] = future
+                pending.append((rel, future))
+                if len(pending) >= 2 * workers:
+                    _apply_persisted(manifest, pending, in_flight)
+                    written += 1
+            while pending:
+                _apply_persisted(manifest, pending, in_flight)
+                written += 1
     except ApiError as e:
         print(f"Error: {e.message}", file=sys.stderr)
         sys.exit(1)
 
-    if not docs:
+    if not written:
         print("No docs found. Your knowledge base is empty.")
         return
 
-    import hashlib
-
-    manifest: mf.Manifest = {}
-    written = 0
-    for doc in docs:
-        rel = _local_path(doc["category"], doc["title"])
-        content = doc.get("content", "")
-        _write_local(rel, content)
-        mf.add_entry(
-            manifest,
-            rel,
-            {
-                "id": doc["id"],
-                "version": doc["version"],
-                "category": doc["category"],
-                "title": doc["title"],
-                "content_hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
-            },
-        )
-        written += 1
-
     mf.save(manifest)
     print(f"Cloned {written} doc(s) → ./{_KNOWLEDGE_DIR}/")
     print("Edit files, then run `mdlm push` to upload changes.")
@@ -151,29 +320,76 @@ def cmd_pull(args: argparse.Namespace) -> None:
         print("Nothing to pull — manifest is empty.")
         return
 
-    import hashlib
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
     client = ApiClient()
-    updated = 0
-    errors = 0
-    for rel_path, entry in list(manifest.items()):
+
+    # One metadata-only listing tells us which docs changed on the server.
+    # If it fails, fall back to asking about every doc individually.
+    try:
+        remote_versions = {
+            d["id"]: d.get("version")
+            for d in client.list_docs(fields=("id", "version"))
+        }
+    except ApiError:
+        remote_versions = {}
+
+    updated = unchanged = errors = 0
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        futures: Dict["Future[Optional[Dict[str, Any]]]", str] = {}
         try:
-            doc = client.get_doc(entry["id"])
-        except ApiError as e:
-            print(f"  error pulling {rel_path}: {e.message}", file=sys.stderr)
-            errors += 1
-            continue
-
-        content = doc.get("content", "")
-        _write_local(rel_path, content)
-        entry["version"] = doc["version"]
-        entry["title"] = doc["title"]
-        entry["category"] = doc["category"]
-        entry["content_hash"] = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        updated += 1
+            # Only entries are mutated here, never the manifest itself: no copy needed
+            for rel_path, entry in manifest.items():
+                # Docs edited locally are always fetched: pull overwrites edits.
+                st = _stat_local(rel_path)
+                in_sync = st is not None and _modified_data(rel_path, entry, st) is None
+                if in_sync:
+                    entry.update(_stat_fields(st))
+                if in_sync and remote_versions.get(entry["id"]) == entry.get("version"):
+                    unchanged += 1
+                    continue
+                etag = entry.get("etag") if in_sync else None
+                futures[pool.submit(client.get_doc, entry["id"], etag)] = rel_path
+
+            # Writes and manifest updates stay on this thread; only the GETs fan out
+            for future in as_completed(futures):
+                rel_path = futures[future]
+                entry = manifest[rel_path]
+                try:
+                    doc = future.result()
+                except ApiError as e:
+                    print(f"  error pulling {rel_path}: {e.message}", file=sys.stderr)
+                    errors += 1
+                    continue
+
+                if doc is None:
+                    unchanged += 1  # 304 Not Modified
+                    continue
+
+                data = doc.get("content", "").encode("utf-8")
+                entry.update(_stat_fields(_write_local_bytes(rel_path, data)))
+                entry["version"] = doc["version"]
+                entry["title"] = doc["title"]
+                entry["category"] = doc["category"]
+                entry["content_hash"] = _sha256_hex(data)
+                if doc.get("etag"):
+                    entry["etag"] = doc["etag"]
+                else:
+                    entry.pop("etag", None)
+                updated += 1
+        except BaseException:
+            # Ctrl-C or an error: drop queued GETs instead of letting the
+            # pool's shutdown(wait=True) run them all before exiting
+            for future in futures:
+                future.cancel()
+            raise
 
     mf.save(manifest)
-    print(f"Pulled {updated} doc(s)." + (f" {errors} error(s)." if errors else ""))
+    print(
+        f"Pulled {updated} doc(s)."
+        + (f" {unchanged} already up to date." if unchanged else "")
+        + (f" {errors} error(s)." if errors else "")
+    )
 
 
 def cmd_status(args: argparse.Namespace) -> None:
@@ -188,45 +404,23 @@ def cmd_status(args: argparse.Namespace) -> None:
     manifest = mf.load()
 
     # Collect all local .md files under knowledge/
-    knowledge_dir = Path(_KNOWLEDGE_DIR)
-    local_files = set()
-    if knowledge_dir.exists():
-        for p in knowledge_dir.rglob("*.md"):
-            local_files.add(str(p))
+    local = _scan_local()
 
-    tracked = set(manifest.keys())
-
-    new_files: List[str] = []
+    new_files: List[str] = list(local.keys() - manifest.keys())
     modified: List[str] = []
     deleted: List[str] = []
 
     # Check tracked files for modifications or deletions
-    for rel_path in tracked:
-        content = _read_local(rel_path)
-        if content is None:
+    for rel_path, entry in manifest.items():
+        st = _stat_local(rel_path)
+        if st is None:
             deleted.append(rel_path)
-        else:
-            # We don't have a local cached copy of the original content,
-            # so we compare against the manifest's known content by re-reading.
-            # Mark as modified if the file exists — user must have edited it.
-            # (After clone/pull, mtime would be a better heuristic, but keeping
-            #  it simple: any tracked file present is "possibly modified".)
-            # To give accurate output we store a content hash in the manifest.
-            entry = manifest[rel_path]
-            stored_hash = entry.get("content_hash")
-            if stored_hash is not None:
-                import hashlib
-                current_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-                if current_hash != stored_hash:
-                    modified.append(rel_path)
-            else:
-                # Old manifest without hashes — can't tell; mark unknown
-                pass
-
-    # Check for new untracked .md files
-    for rel_path in local_files:
-        if rel_path not in tracked:
-            new_files.append(rel_path)
+        elif entry.get("content_hash") is None:
+            # Old manifest without hashes — can't tell; mark unknown
+            pass
+        elif _modified_data(rel_path, entry, st) is not None:
+            # Only files whose size/mtime moved since the last sync get hashed
+            modified.append(rel_path)
 
     if not new_files and not modified and not deleted:
         print("Nothing to push — no changes detected.")
@@ -263,90 +457,74 @@ def cmd_push(args: argparse.Namespace) -> None:
     if category_filter and category_filter not in VALID_CATEGORIES:
         print(
             f"Error: Unknown category '{category_filter}'.\n"
-            f"Valid categories: {', '.join(sorted(VALID_CATEGORIES))}",
+            f"Valid categories: {VALID_CATEGORIES_HELP}",
             file=sys.stderr,
         )
         sys.exit(1)
 
     client = ApiClient()
-    import hashlib
 
+    local = _scan_local()
+    new_paths = sorted(local.keys() - manifest.keys())
     created = updated = deleted_count = errors = 0
+    to_update: List[_PendingUpdate] = []
 
-    # 1. Handle tracked files (update or delete)
-    for rel_path, entry in list(manifest.items()):
-        if category_filter and entry.get("category") != category_filter:
-            continue
+    try:
+        # 1. Handle tracked files (update or delete).  --delete pops entries,
+        #    so iterate over a snapshot of the keys only.
+        for rel_path in list(manifest):
+            entry = manifest.get(rel_path)
+            if entry is None:
+                continue
+            if category_filter and entry.get("category") != category_filter:
+                continue
 
-        content = _read_local(rel_path)
+            st = _stat_local(rel_path)
+
+            # --- Deleted locally ---
+            if st is None:
+                if args.delete:
+                    try:
+                        client.delete_doc(entry["id"])
+                        mf.remove_entry(manifest, rel_path)
+                        print(f"  deleted  {rel_path}")
+                        deleted_count += 1
+                    except ApiError as e:
+                        print(f"  error deleting {rel_path}: {e.message}", file=sys.stderr)
+                        errors += 1
+                else:
+                    print(
+                        f"  skipped  {rel_path} (deleted locally; re-run with --delete to remove remotely)"
+                    )
+                continue
 
-        # --- Deleted locally ---
-        if content is None:
-            if args.delete:
-                try:
-                    client.delete_doc(entry["id"])
-                    mf.remove_entry(manifest, rel_path)
-                    print(f"  deleted  {rel_path}")
-                    deleted_count += 1
-                except ApiError as e:
-                    print(f"  error deleting {rel_path}: {e.message}", file=sys.stderr)
-                    errors += 1
+            # --- Check if content changed (uses stored stat + hash) ---
+            data = _modified_data(rel_path, entry, st)
+            if data is None:
+                entry.update(_stat_fields(st))
+                continue  # unchanged
+            to_update.append((rel_path, entry, data.decode("utf-8"), _sha256_hex(data), st))
+
+        # --- Push updates (the server checks each version via If-Match) ---
+        for update, result in _push_updates(client, to_update, change_reason):
+            rel_path, entry, _, current_hash, st = update
+            doc = result.get("doc")
+            if doc is not None:
+                entry["version"] = doc["version"]
+                entry["content_hash"] = current_hash
+                entry.update(_stat_fields(st))
+                print(f"  updated  {rel_path} (v{doc['version']})")
+                updated += 1
+            elif result.get("status") in (409, 412):
+                _report_conflict(client, rel_path, entry["id"], entry.get("version", 0))
+                errors += 1
             else:
-                print(
-                    f"  skipped  {rel_path} (deleted locally; re-run with --delete to remove remotely)"
-                )
-            continue
-
-        # --- Check if content changed (uses stored hash) ---
-        stored_hash = entry.get("content_hash")
-        current_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        if stored_hash == current_hash:
-            continue  # unchanged
-
-        # --- Version conflict check ---
-        try:
-            remote_doc = client.get_doc(entry["id"])
-        except ApiError as e:
-            print(f"  error checking {rel_path}: {e.message}", file=sys.stderr)
-            errors += 1
-            continue
-
-        remote_version = remote_doc.get("version", 0)
-        local_version = entry.get("version", 0)
-        if remote_version != local_version:
-            print(
-                f"  conflict {rel_path}: "
-                f"local version {local_version} != server version {remote_version}.\n"
-                f"           Run `mdlm pull` to get the latest, then re-apply your edits.",
-                file=sys.stderr,
-            )
-            errors += 1
-            continue
-
-        # --- Push update ---
-        try:
-            doc = client.update_doc(
-                entry["id"],
-                entry["title"],
-                content,
-                entry["category"],
-                change_reason=change_reason,
-            )
-            entry["version"] = doc["version"]
-            entry["content_hash"] = current_hash
-            mf.save(manifest)
-            print(f"  updated  {rel_path} (v{doc['version']})")
-            updated += 1
-        except ApiError as e:
-            print(f"  error updating {rel_path}: {e.message}", file=sys.stderr)
-            errors += 1
+                print(f"  error updating {rel_path}: {result.get('error')}", file=sys.stderr)
+                errors += 1
 
-    # 2. Handle new untracked .md files under knowledge/
-    if knowledge_dir.exists():
-        for p in sorted(knowledge_dir.rglob("*.md")):
-            rel_path = str(p)
-            if rel_path in manifest:
-                continue  # already handled above
+        # 2. Handle new untracked .md files under knowledge/
+        for rel_path in new_paths:
+            p = local[rel_path]
 
             # Infer category from directory name
             parts = p.relative_to(knowledge_dir).parts
@@ -357,12 +535,13 @@ def cmd_push(args: argparse.Namespace) -> None:
             if category_filter and inferred_category != category_filter:
                 continue
 
-            content = p.read_text(encoding="utf-8")
+            st = p.stat()
+            data = _read_normalized(p)
             title = p.name  # already ends in .md
 
             try:
-                doc = client.create_doc(title, content, inferred_category)
-                current_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+                doc = client.create_doc(title, data.decode("utf-8"), inferred_category)
+                current_hash = _sha256_hex(data)
                 mf.add_entry(
                     manifest,
                     rel_path,
@@ -372,14 +551,17 @@ def cmd_push(args: argparse.Namespace) -> None:
                         "category": doc["category"],
                         "title": doc["title"],
                         "content_hash": current_hash,
+                        **_stat_fields(st),
                     },
                 )
-                mf.save(manifest)
                 print(f"  created  {rel_path}")
                 created += 1
             except ApiError as e:
                 print(f"  error creating {rel_path}: {e.message}", file=sys.stderr)
                 errors += 1
+    finally:
+        # Persist progress even if a request fails or the user hits Ctrl-C
+        mf.save(manifest)
 
     # Summary
     parts = []
@@ -406,7 +588,7 @@ def cmd_query(args: argparse.Namespace) -> None:
     if category not in VALID_CATEGORIES:
         print(
             f"Error: Unknown category '{category}'.\n"
-            f"Valid categories: {', '.join(sorted(VALID_CATEGORIES))}",
+            f"Valid categories: {VALID_CATEGORIES_HELP}",
             file=sys.stderr,
         )
         sys.exit(1)
@@ -439,7 +621,7 @@ def cmd_validate(args: argparse.Namespace) -> None:
     if category not in VALID_CATEGORIES:
         print(
             f"Error: Unknown category '{category}'.\n"
-            f"Valid categories: {', '.join(sorted(VALID_CATEGORIES))}",
+            f"Valid categories: {VALID_CATEGORIES_HELP}",
             file=sys.stderr,
         )
         sys.exit(1)
@@ -480,7 +662,7 @@ def cmd_resolve_gap(args: argparse.Namespace) -> None:
     if category not in VALID_CATEGORIES:
         print(
             f"Error: Unknown category '{category}'.\n"
-            f"Valid categories: {', '.join(sorted(VALID_CATEGORIES))}",
+            f"Valid categories: {VALID_CATEGORIES_HELP}",
             file=sys.stderr,
         )
         sys.exit(1)
@@ -514,35 +696,16 @@ def cmd_resolve_gap(args: argparse.Namespace) -> None:
 # Argument parser
 # ---------------------------------------------------------------------------
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="mdlm",
-        description="markdownlm knowledge base CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    parser.add_argument("--version", action="version", version=f"mdlm {__version__}")
-
-    sub = parser.add_subparsers(dest="command", metavar="<command>")
-    sub.required = True
-
-    # configure
-    sub.add_parser("configure", help="Save your API key securely")
-
-    # clone
+def _add_clone(sub: "argparse._SubParsersAction") -> None:
     p_clone = sub.add_parser("clone", help="Download your knowledge base")
     p_clone.add_argument(
         "--category", "-c",
         metavar="CATEGORY",
-        help=f"Only clone this category ({', '.join(sorted(VALID_CATEGORIES))})",
+        help=f"Only clone this category ({VALID_CATEGORIES_HELP})",
     )
 
-    # pull
-    sub.add_parser("pull", help="Refresh docs from the server (overwrites local)")
-
-    # status
-    sub.add_parser("status", help="Show local changes")
 
-    # push
+def _add_push(sub: "argparse._SubParsersAction") -> None:
     p_push = sub.add_parser("push", help="Upload local changes to the server")
     p_push.add_argument(
         "--message", "-m",
@@ -560,7 +723,8 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Also delete docs that have been removed locally",
     )
 
-    # query
+
+def _add_query(sub: "argparse._SubParsersAction") -> None:
     p_query = sub.add_parser("query", help="Query the knowledge base")
     p_query.add_argument(
         "query",
@@ -571,10 +735,11 @@ def _build_parser() -> argparse.ArgumentParser:
         "--category", "-c",
         metavar="CATEGORY",
         default="general",
-        help=f"The domain to query ({', '.join(sorted(VALID_CATEGORIES))}; default: general)",
+        help=f"The domain to query ({VALID_CATEGORIES_HELP}; default: general)",
     )
 
-    # validate
+
+def _add_validate(sub: "argparse._SubParsersAction") -> None:
     p_validate = sub.add_parser("validate", help="Validate code against rules")
     p_validate.add_argument(
         "code",
@@ -591,10 +756,11 @@ def _build_parser() -> argparse.ArgumentParser:
         "--category", "-c",
         metavar="CATEGORY",
         default="general",
-        help=f"The domain to validate against ({', '.join(sorted(VALID_CATEGORIES))}; default: general)",
+        help=f"The domain to validate against ({VALID_CATEGORIES_HELP}; default: general)",
     )
 
-    # resolve-gap
+
+def _add_resolve_gap(sub: "argparse._SubParsersAction") -> None:
     p_gap = sub.add_parser("resolve-gap", help="Resolve documentation gaps")
     p_gap.add_argument(
         "question",
@@ -605,9 +771,47 @@ def _build_parser() -> argparse.ArgumentParser:
         "--category", "-c",
         metavar="CATEGORY",
         default="general",
-        help=f"The domain ({', '.join(sorted(VALID_CATEGORIES))}; default: general)",
+        help=f"The domain ({VALID_CATEGORIES_HELP}; default: general)",
     )
 
+
+# Subcommand name → function adding its subparser, in `mdlm --help` order
+_SUBPARSERS: Dict[str, Callable[["argparse._SubParsersAction"], Any]] = {
+    "configure": lambda sub: sub.add_parser("configure", help="Save your API key securely"),
+    "clone": _add_clone,
+    "pull": lambda sub: sub.add_parser(
+        "pull", help="Refresh docs from the server (overwrites local)"
+    ),
+    "status": lambda sub: sub.add_parser("status", help="Show local changes"),
+    "push": _add_push,
+    "query": _add_query,
+    "validate": _add_validate,
+    "resolve-gap": _add_resolve_gap,
+}
+
+# Built parsers, keyed by the single subcommand they contain (None = all)
+_PARSERS: Dict[Optional[str], argparse.ArgumentParser] = {}
+
+
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Return the (memoized) parser, with only *command*'s subparser if given."""
+    if command in _PARSERS:
+        return _PARSERS[command]
+
+    parser = argparse.ArgumentParser(
+        prog="mdlm",
+        description="markdownlm knowledge base CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--version", action="version", version=f"mdlm {__version__}")
+
+    sub = parser.add_subparsers(dest="command", metavar="<command>")
+    sub.required = True
+    for name, add_subparser in _SUBPARSERS.items():
+        if command is None or name == command:
+            add_subparser(sub)
+
+    _PARSERS[command] = parser
     return parser
 
 
@@ -624,8 +828,11 @@ _COMMANDS = {
 
 
 def main() -> None:
-    parser = _build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    # Only the chosen subcommand's parser is built; --help, --version and
+    # unknown commands get the full parser so usage/errors list everything.
+    command = argv[0] if argv and argv[0] in _COMMANDS else None
+    args = _build_parser(command).parse_args(argv)
     _COMMANDS[args.command](args)
 
 
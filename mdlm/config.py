@@ -86,3 +86,11 @@ def get_api_url() -> str:
         )
         sys.exit(1)
     return url
+
+
+def compress_requests_enabled() -> bool:
+    """Return True if large request bodies should be gzipped.
+
+    Off by default because the server must accept `Content-Encoding: gzip`.
+    """
+    return os.environ.get("MDLM_COMPRESS_REQUESTS", "").strip() == "1"
@@ -0,0 +1,17 @@
+"""Shared constants that are cheap to import (no HTTP stack)."""
+
+VALID_CATEGORIES = {
+    "architecture",
+    "stack",
+    "testing",
+    "deployment",
+    "security",
+    "style",
+    "dependencies",
+    "error_handling",
+    "business_logic",
+    "general",
+}
+
+# Pre-rendered for help text and error messages
+VALID_CATEGORIES_HELP = ", ".join(sorted(VALID_CATEGORIES))
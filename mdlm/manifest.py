@@ -6,10 +6,16 @@ and perform version conflict checks before sending updates to the server.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # optional: much faster parse/dump for large manifests
+except ImportError:
+    orjson = None
+
 _MDLM_DIR = ".mdlm"
 _MANIFEST_FILE = ".mdlm/manifest.json"
 
@@ -18,7 +24,12 @@ _MANIFEST_FILE = ".mdlm/manifest.json"
 #   "id": "<uuid>",
 #   "version": <int>,
 #   "category": "<category>",
-#   "title": "<title>.md"
+#   "title": "<title>.md",
+#   "content_hash": "<sha256 of the file as last synced>",
+#   "etag": "<server ETag, optional>",
+#   "mtime_ns": <int>,   # stat of the file as last synced; lets status
+#   "size": <int>,       # skip hashing files that haven't been touched
+#   "synced_ns": <int>   # when that stat was taken; see cli._modified_data
 # }
 Entry = Dict[str, Any]
 Manifest = Dict[str, Entry]   # key = relative path string
@@ -35,7 +46,8 @@ def load(root: Optional[Path] = None) -> Manifest:
     if not p.exists():
         return {}
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        data = p.read_bytes()
+        return orjson.loads(data) if orjson else json.loads(data)
     except (json.JSONDecodeError, OSError) as exc:
         print(f"Error reading manifest: {exc}", file=sys.stderr)
         sys.exit(1)
@@ -46,7 +58,14 @@ def save(manifest: Manifest, root: Optional[Path] = None) -> None:
     root = root or Path.cwd()
     p = _manifest_path(root)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    # Write then rename so an interrupted save never leaves a truncated manifest
+    tmp = p.with_name(p.name + ".tmp")
+    if orjson:
+        data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp.write_bytes(data)
+    os.replace(tmp, p)
 
 
 def add_entry(manifest: Manifest, rel_path: str, entry: Entry) -> None: